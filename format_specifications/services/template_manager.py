@@ -2,15 +2,34 @@
 Template management service for template CRUD operations
 """
 import logging
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from django.contrib.auth.models import User
 from format_specifications.models import DocumentTemplate, TemplateUsageLog
-from format_specifications.utils.predefined_templates import PREDEFINED_TEMPLATES, get_template as get_predefined_template
+from format_specifications.utils.predefined_templates import (
+    PREDEFINED_TEMPLATES,
+    get_template as get_predefined_template,
+    get_template_dict as get_predefined_template_dict,
+)
 from format_specifications.utils.template_validator import TemplateValidator
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _predefined_template_entries() -> Tuple[Tuple[str, str, str, str], ...]:
+    """
+    Listing entries for the predefined templates
+
+    PREDEFINED_TEMPLATES is static for the lifetime of the process, so the
+    entries are built once and reused by every listing call.
+    """
+    return tuple(
+        (template_id, template.name, template.category, 'system')
+        for template_id, template in PREDEFINED_TEMPLATES.items()
+    )
+
+
 class TemplateManager:
     """Service for managing document templates"""
 
@@ -66,16 +85,8 @@ class TemplateManager:
         Returns:
             List of tuples: (template_id, name, category, template_type)
         """
-        templates = []
-
         # Add predefined templates
-        for template_id, template in PREDEFINED_TEMPLATES.items():
-            templates.append((
-                template_id,
-                template.name,
-                template.category,
-                'system'
-            ))
+        templates = list(_predefined_template_entries())
 
         # Add user templates from database
         if user:
@@ -310,6 +321,12 @@ class TemplateManager:
         Returns:
             Dictionary with template details or None
         """
+        # Predefined templates: reuse the cached serialization (copied, since 'type' is added)
+        if template_id in PREDEFINED_TEMPLATES:
+            template_dict = dict(get_predefined_template_dict(template_id))
+            template_dict['type'] = 'system'
+            return template_dict
+
         template = TemplateManager.get_template(template_id, user)
 
         if not template:
@@ -324,10 +341,7 @@ class TemplateManager:
             'sections': [s.__dict__ for s in template.sections] if hasattr(template.sections[0], '__dict__') else []
         }
 
-        # Add template type
-        if template_id in PREDEFINED_TEMPLATES:
-            template_dict['type'] = 'system'
-        else:
-            template_dict['type'] = 'user'
+        # Predefined ids returned above, so anything reaching here is a user template
+        template_dict['type'] = 'user'
 
         return template_dict
@@ -148,6 +148,22 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 缓存配置
+# ai_results: 模板生成结果的文件缓存，进程重启后仍然有效，避免相同输入重复调用 AI 接口
+# 默认关闭（生产环境每次生成都应调用 AI）；测试配置或设置环境变量 AI_RESULT_CACHE=1 时启用
+# 设置环境变量 AI_CACHE_BUST=1 可跳过缓存读取
+AI_RESULT_CACHE_ENABLED = os.getenv('AI_RESULT_CACHE') == '1'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'ai_results': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.ai_cache',
+        'TIMEOUT': 60 * 60 * 24,  # 24 小时
+    },
+}
+
 # 日志配置
 import os
 LOG_DIR = BASE_DIR / 'logs'
@@ -1,6 +1,11 @@
 from zhipuai import ZhipuAI
 from django.conf import settings
+from django.core.cache import caches
+import hashlib
+import json
 import logging
+import os
+import re
 import time
 from functools import wraps
 import requests
@@ -50,6 +55,69 @@ def cache_text_result(expire_seconds=30):
     return decorator
 
 
+def _all_section_ids(template):
+    """返回模板中所有章节（含嵌套子章节）的 ID 列表"""
+    section_ids = []
+    stack = list(template.sections)
+    while stack:
+        section = stack.pop()
+        section_ids.append(section.id)
+        stack.extend(section.subsections)
+    return section_ids
+
+
+def cache_template_generation(cache_alias='ai_results'):
+    """
+    装饰器：缓存模板生成结果，相同模板 + 输入直接返回缓存，避免重复调用 AI 接口
+
+    默认关闭，仅当 settings.AI_RESULT_CACHE_ENABLED 为 True 时生效（用于测试重跑，
+    生产环境的“重新生成”必须得到新结果）。
+    缓存键为模板内容、用户大纲、源文档文本、语调和模型的 SHA-256 摘要；
+    只有所有章节都生成了内容时才写入缓存，避免把接口临时失败导致的残缺结果缓存下来。
+    设置环境变量 AI_CACHE_BUST=1 可跳过缓存读取。
+
+    :param cache_alias: Django 缓存别名（默认 'ai_results'，见 settings.CACHES）
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, template, user_outline="", source_document_text="", tone=None, *args, **kwargs):
+            if not getattr(settings, 'AI_RESULT_CACHE_ENABLED', False):
+                return func(self, template, user_outline, source_document_text, tone, *args, **kwargs)
+
+            key_payload = json.dumps(
+                [func.__name__, template.to_dict(), user_outline, source_document_text, self.tone, self.model],
+                sort_keys=True,
+                ensure_ascii=False
+            )
+            cache_key = f"template_generation:{hashlib.sha256(key_payload.encode('utf-8')).hexdigest()}"
+            store = caches[cache_alias]
+
+            if os.environ.get("AI_CACHE_BUST") != "1":
+                try:
+                    cached_result = store.get(cache_key)
+                except Exception as e:
+                    logger.warning(f"读取生成结果缓存失败: {str(e)}")
+                    cached_result = None
+
+                if cached_result is not None:
+                    logger.info("命中模板生成缓存，直接返回结果（无需重复调用 AI）")
+                    self.log_callback(f"✓ 命中缓存：{len(cached_result)} 个章节")
+                    return cached_result
+
+            result = func(self, template, user_outline, source_document_text, tone, *args, **kwargs)
+
+            # 仅缓存完整结果：任一章节缺失或为空都说明生成过程中有失败
+            if result and all(result.get(section_id) for section_id in _all_section_ids(template)):
+                try:
+                    store.set(cache_key, result)
+                except Exception as e:
+                    logger.warning(f"写入生成结果缓存失败: {str(e)}")
+
+            return result
+        return wrapper
+    return decorator
+
+
 def retry_on_connection_error(max_retries=3, backoff_factor=2, fallback_return=""):
     """
     装饰器：在连接错误时重试 AI 调用（指数退避策略）
@@ -100,6 +168,34 @@ def retry_on_connection_error(max_retries=3, backoff_factor=2, fallback_return="
     return decorator
 
 class AITextProcessor:
+    # 语义分割的标题模式（按行首匹配）
+    HEADING_PATTERNS = [
+        r'[一二三四五六七八九十]+、',            # 中文序号：一、
+        r'\d+[\.．、\)）]',                      # 阿拉伯数字：1. / 1、 / 1)
+        r'第[一二三四五六七八九十\d]+[章节部分]',  # 章节标记：第一章
+        r'#+\s',                                # Markdown 标题
+    ]
+    # 合并为单个多行模式，一次扫描即可得到全部标题位置
+    HEADING_PATTERN = re.compile(
+        '|'.join(f'^(?:{p})' for p in HEADING_PATTERNS),
+        re.MULTILINE
+    )
+
+    # 分句模式：非结束标点的一段文字连同其后连续的结束标点（中英文）构成一句；
+    # 每个分支都无需回溯，整体为线性扫描
+    SENTENCE_PATTERN = re.compile(r'[^。！？.!?]+(?:[。！？.!?]+|$)|[。！？.!?]+')
+
+    # 语调对应的提示词（类级常量，避免每次调用重建字典）
+    TONE_INSTRUCTIONS = {
+        'no_preference': "请保持客观、中立的语调。",
+        'direct': "请使用简洁、直接的语调，避免冗余表达，直奔主题。",
+        'rigorous': "请使用严谨、专业的语调，使用准确的术语和完整的表达。",
+        'empathetic': "请使用亲切、温暖的语调，体现关怀和理解。",
+        'inspirational': "请使用鼓舞人心的语调，传递积极向上的能量。",
+        'humorous': "请使用轻松有趣的语调，可以适当加入幽默元素。",
+        'cold_sharp': "请使用权威、果断的语调，直接陈述，不带情感色彩。"
+    }
+
     def __init__(self, tone='no_preference', log_callback=None):
         """
         初始化智谱 AI 客户端，配置超时参数
@@ -210,18 +306,9 @@ class AITextProcessor:
 
         :return: 语调提示文字符串
         """
-        tone_map = {
-            'no_preference': "请保持客观、中立的语调。",
-            'direct': "请使用简洁、直接的语调，避免冗余表达，直奔主题。",
-            'rigorous': "请使用严谨、专业的语调，使用准确的术语和完整的表达。",
-            'empathetic': "请使用亲切、温暖的语调，体现关怀和理解。",
-            'inspirational': "请使用鼓舞人心的语调，传递积极向上的能量。",
-            'humorous': "请使用轻松有趣的语调，可以适当加入幽默元素。",
-            'cold_sharp': "请使用权威、果断的语调，直接陈述，不带情感色彩。"
-        }
-
-        return tone_map.get(self.tone, "请保持客观、中立的语调。")
+        return self.TONE_INSTRUCTIONS.get(self.tone, self.TONE_INSTRUCTIONS['no_preference'])
 
+    @cache_template_generation()
     def generate_from_template(
         self,
         template,
@@ -263,6 +350,7 @@ class AITextProcessor:
         process_sections(template.sections)
         return generated_content
 
+    @cache_template_generation()
     def generate_from_template_batch(
         self,
         template,
@@ -273,6 +361,9 @@ class AITextProcessor:
         """
         根据模板生成内容（批量处理模式）
 
+        只发起一次 AI 请求，要求模型返回以章节 ID 为键的 JSON 对象。
+        JSON 中缺失的章节逐个补充生成；请求失败或 JSON 无法解析时降级到顺序处理模式。
+
         参数:
         - template: 模板对象
         - user_outline: 用户大纲
@@ -282,14 +373,12 @@ class AITextProcessor:
         返回:
         - dict: {section_id: generated_content}
         """
-        # 批量模式：一次性处理所有章节
-        generated_content = {}
+        # 收集所有章节（包括子章节），保持模板顺序
+        all_sections = []
 
-        # 构建所有章节的提示
-        sections_info = []
         def collect_sections(sections):
             for section in sections:
-                sections_info.append(f"- {section.title}")
+                all_sections.append(section)
                 if section.subsections:
                     collect_sections(section.subsections)
 
@@ -297,32 +386,29 @@ class AITextProcessor:
 
         # 构建批量提示词
         tone_instruction = self._get_tone_instruction()
-        sections_list = "\n".join(sections_info)
+        sections_list = "\n".join(
+            f"- {section.id}：{section.title}"
+            + (f"（约{section.word_count}字）" if section.word_count else "")
+            for section in all_sections
+        )
+        section_ids = ", ".join(section.id for section in all_sections)
 
         prompt = f"""{tone_instruction}
 
 请根据以下模板结构，为每个章节生成内容。
 
-模板章节：
+模板章节（章节ID：章节标题）：
 {sections_list}
 
 用户大纲：{user_outline}
 
-源文档内容：{source_document_text[:2000]}
-
-请为每个章节生成详细内容，按照以下格式返回：
-章节1标题
-[章节1内容]
-
-章节2标题
-[章节2内容]
-
-...
+源文档内容：{source_document_text[:2000] if source_document_text else "无"}
 
-请确保内容专业、完整，每个章节至少200字。"""
+请只返回一个 JSON 对象，不要包含任何解释。JSON 的键为章节ID（{section_ids}），值为该章节的详细内容（不要包含章节标题）。
+请确保内容专业、完整。"""
 
         try:
-            self.log_callback("正在批量生成所有章节内容...")
+            self.log_callback(f"正在批量生成所有章节内容（{len(all_sections)} 个章节，单次请求）...")
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -335,38 +421,61 @@ class AITextProcessor:
             )
 
             content = response.choices[0].message.content.strip()
+            batch_content = self._parse_json_object(content)
 
-            # 解析返回的内容，分配到各个章节
-            current_section = None
-            current_content = []
+        except Exception as e:
+            logger.error(f"批量生成失败: {str(e)}")
+            self.log_callback(f"⚠️ 批量生成失败: {str(e)}")
+            # 降级到顺序处理模式
+            self.log_callback("降级到顺序处理模式...")
+            return self.generate_from_template(template, user_outline, source_document_text, tone)
 
-            def assign_sections(sections):
-                for section in sections:
-                    if current_section and current_content:
-                        generated_content[current_section.id] = "\n".join(current_content)
-                        self.log_callback(f"✓ 已生成: {section.title}")
-                        current_content.clear()
+        # 按模板顺序分配内容，缺失的章节单独补充生成
+        generated_content = {}
+        for section in all_sections:
+            section_content = batch_content.get(section.id)
+            if isinstance(section_content, str) and section_content.strip():
+                generated_content[section.id] = section_content.strip()
+                self.log_callback(f"✓ 已生成: {section.title}")
+                continue
+
+            logger.warning(f"批量结果缺少章节 '{section.id}'，单独生成")
+            section_content = self._generate_section_content(
+                section,
+                user_outline,
+                source_document_text
+            )
+            if section_content:
+                generated_content[section.id] = section_content
+                self.log_callback(f"✓ 已生成: {section.title}")
 
-                    current_section = section
+        return generated_content
 
-                    if section.subsections:
-                        assign_sections(section.subsections)
+    @staticmethod
+    def _parse_json_object(content):
+        """
+        从 AI 返回内容中解析 JSON 对象（兼容 ```json 代码块等包裹）
 
-                # 最后一个章节
-                if current_section and current_content:
-                    generated_content[current_section.id] = "\n".join(current_content)
+        参数:
+        - content: AI 返回的文本
 
-            assign_sections(template.sections)
+        返回:
+        - dict: 解析结果
 
-            return generated_content
+        异常:
+        - ValueError: 内容中不包含合法的 JSON 对象
+        """
+        start = content.find("{")
+        end = content.rfind("}")
+        if start == -1 or end <= start:
+            raise ValueError("AI 返回内容中未找到 JSON 对象")
 
-        except Exception as e:
-            logger.error(f"批量生成失败: {str(e)}")
-            self.log_callback(f"⚠️ 批量生成失败: {str(e)}")
-            # 降级到顺序处理模式
-            self.log_callback("降级到顺序处理模式...")
-            return self.generate_from_template(template, user_outline, source_document_text, tone)
+        parsed = json.loads(content[start:end + 1])
+        if not isinstance(parsed, dict):
+            raise ValueError("AI 返回的 JSON 不是对象")
+        return parsed
 
+    @cache_template_generation()
     def generate_from_template_parallel(
         self,
         template,
@@ -601,12 +710,9 @@ class AITextProcessor:
         if mode == "paragraph":
             segments = text.split("\n\n")
         elif mode == "sentence":
-            import re
-            segments = re.split(r'[。！？\.!?]', text)
-            segments = [s.strip() for s in segments if s.strip()]
+            segments = self._segment_by_sentences(text)
         elif mode == "semantic":
-            # 语义分割：按段落分割（简单实现）
-            segments = text.split("\n\n")
+            segments = self._segment_by_semantic(text)
         else:
             segments = [text]
 
@@ -622,6 +728,54 @@ class AITextProcessor:
         else:
             return segments
 
+    def _segment_by_sentences(self, text):
+        """
+        按句子分割文本（编译后的 SENTENCE_PATTERN 单次线性扫描）
+
+        连续的结束标点（如 "？！"、"..."）归入同一句，句末标点保留在句子中。
+
+        参数:
+        - text: 要分割的文本
+
+        返回:
+        - list: 去除首尾空白后的非空句子列表
+        """
+        return [
+            sentence
+            for match in self.SENTENCE_PATTERN.finditer(text)
+            if (sentence := match.group().strip())
+        ]
+
+    def _segment_by_semantic(self, text):
+        """
+        按标题进行语义分割
+
+        先用 HEADING_PATTERN 一次扫描收集所有标题的起始位置，再按相邻位置切片，
+        每个片段包含标题及其下方内容；首个标题之前的内容单独成段。
+        未检测到任何标题时退化为按段落分割。
+
+        参数:
+        - text: 要分割的文本
+
+        返回:
+        - list: 去除首尾空白后的非空片段列表
+        """
+        boundaries = [match.start() for match in self.HEADING_PATTERN.finditer(text)]
+        if not boundaries:
+            return [s.strip() for s in text.split("\n\n") if s.strip()]
+
+        if boundaries[0] != 0:
+            boundaries.insert(0, 0)
+        boundaries.append(len(text))
+
+        sections = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            section = text[start:end].strip()
+            if section:
+                sections.append(section)
+
+        return sections
+
     @retry_on_connection_error(max_retries=3, backoff_factor=2)
     def _generate_section_content(self, section, user_outline, source_text):
         """
@@ -7,6 +7,7 @@ reinsert them into AI-generated template-based documents.
 """
 import os
 import shutil
+import tempfile
 import zipfile
 import logging
 from typing import List, Dict, Tuple
@@ -23,16 +24,30 @@ class DocumentImageTracker:
     for later semantic matching to template sections.
     """
 
-    def __init__(self, docx_path: str):
+    # XML fragments that indicate an image inside a paragraph or run
+    _IMAGE_XML_PATTERNS = (
+        '<w:drawing>',
+        '<pic:pic>',
+        '<v:shape',
+        '<v:image',
+        '<w:pict>',
+        'a:graphic',  # Office 2007+ format
+        'wp:inline',   # Inline floating image
+        'wp:anchor'    # Anchored floating image
+    )
+
+    def __init__(self, docx_path):
         """
         Initialize the image tracker.
 
         Args:
-            docx_path: Path to the source Word document
+            docx_path: Path to the source Word document, or a binary
+                file-like object (e.g. io.BytesIO) holding its contents
         """
         self.docx_path = docx_path
         self.temp_dir = None
         self.images = []  # List[ImageMetadata]
+        self._paragraph_text_cache = None  # (doc, [stripped paragraph text])
 
     def extract_images_with_context(self) -> List[Dict]:
         """
@@ -59,13 +74,16 @@ class DocumentImageTracker:
 
         logger.info(f"Starting image extraction from: {self.docx_path}")
 
-        doc = Document(self.docx_path)
+        doc = Document(self._rewound_source())
         total_paragraphs = len(doc.paragraphs)
         logger.info(f"Document has {total_paragraphs} paragraphs")
 
-        # Create temp directory for images
-        self.temp_dir = os.path.join(os.path.dirname(self.docx_path), 'docx_temp_images')
-        os.makedirs(self.temp_dir, exist_ok=True)
+        # Create temp directory for images (next to the file, or a fresh one for streams)
+        if self._is_stream():
+            self.temp_dir = tempfile.mkdtemp(prefix='docx_temp_images_')
+        else:
+            self.temp_dir = os.path.join(os.path.dirname(self.docx_path), 'docx_temp_images')
+            os.makedirs(self.temp_dir, exist_ok=True)
         logger.info(f"Created temp directory: {self.temp_dir}")
 
         # Extract images using zipfile
@@ -91,12 +109,15 @@ class DocumentImageTracker:
                         'paragraph_index': idx,
                         'preceding_text': self._get_preceding_text(doc, idx),
                         'following_text': self._get_following_text(doc, idx),
-                        'paragraph_text': para.text.strip()
+                        'paragraph_text': self._paragraph_texts(doc)[idx]
                     })
                     image_index += 1
                 else:
                     logger.warning(f"More image-containing paragraphs ({paragraphs_with_images}) than extracted images ({len(image_paths)})")
 
+        # Release the document held by the text cache
+        self._paragraph_text_cache = None
+
         logger.info(f"Image extraction complete:")
         logger.info(f"  - Total paragraphs scanned: {total_paragraphs}")
         logger.info(f"  - Paragraphs with images: {paragraphs_with_images}")
@@ -109,6 +130,21 @@ class DocumentImageTracker:
 
         return self.images
 
+    def _is_stream(self) -> bool:
+        """Whether the document source is a file-like object rather than a path"""
+        return hasattr(self.docx_path, 'read')
+
+    def _rewound_source(self):
+        """
+        Return the document source, seeking streams back to the start.
+
+        Both python-docx and zipfile read the source, so a stream must be
+        rewound before each use.
+        """
+        if self._is_stream():
+            self.docx_path.seek(0)
+        return self.docx_path
+
     def _extract_images_from_zipfile(self) -> List[str]:
         """
         Extract images from docx file using zipfile.
@@ -121,7 +157,7 @@ class DocumentImageTracker:
         image_paths = []
 
         try:
-            with zipfile.ZipFile(self.docx_path, 'r') as zip_ref:
+            with zipfile.ZipFile(self._rewound_source(), 'r') as zip_ref:
                 # Find all image files
                 for file in zip_ref.namelist():
                     if file.startswith('word/media/'):
@@ -164,24 +200,14 @@ class DocumentImageTracker:
         try:
             # Method 1: Check paragraph-level XML for common image patterns
             para_xml = paragraph._element.xml
-            xml_patterns = [
-                '<w:drawing>',
-                '<pic:pic>',
-                '<v:shape',
-                '<v:image',
-                '<w:pict>',
-                'a:graphic',  # Office 2007+ format
-                'wp:inline',   # Inline floating image
-                'wp:anchor'    # Anchored floating image
-            ]
-            if any(pattern in para_xml for pattern in xml_patterns):
+            if any(pattern in para_xml for pattern in self._IMAGE_XML_PATTERNS):
                 logger.debug(f"Found image in paragraph using XML pattern detection")
                 return True
 
             # Method 2: Check runs within paragraph for images
             for run in paragraph.runs:
                 run_xml = run._element.xml
-                if any(pattern in run_xml for pattern in xml_patterns):
+                if any(pattern in run_xml for pattern in self._IMAGE_XML_PATTERNS):
                     logger.debug(f"Found image in paragraph using run-level detection")
                     return True
 
@@ -209,8 +235,8 @@ class DocumentImageTracker:
             Combined text from preceding paragraphs
         """
         start_idx = max(0, current_idx - window)
-        paragraphs = doc.paragraphs[start_idx:current_idx]
-        return ' '.join([p.text.strip() for p in paragraphs if p.text.strip()])
+        texts = self._paragraph_texts(doc)[start_idx:current_idx]
+        return ' '.join(text for text in texts if text)
 
     def _get_following_text(self, doc, current_idx: int, window: int = 3) -> str:
         """
@@ -224,9 +250,29 @@ class DocumentImageTracker:
         Returns:
             Combined text from following paragraphs
         """
-        end_idx = min(len(doc.paragraphs), current_idx + window + 1)
-        paragraphs = doc.paragraphs[current_idx + 1:end_idx]
-        return ' '.join([p.text.strip() for p in paragraphs if p.text.strip()])
+        texts = self._paragraph_texts(doc)[current_idx + 1:current_idx + window + 1]
+        return ' '.join(text for text in texts if text)
+
+    def _paragraph_texts(self, doc) -> List[str]:
+        """
+        Get the stripped text of every paragraph in the document.
+
+        doc.paragraphs re-walks the body XML and re-reads run text on each
+        access, so the texts are materialized once per document and reused
+        for every image's context window. The document is treated as
+        read-only while cached.
+
+        Args:
+            doc: python-docx Document object
+
+        Returns:
+            List of stripped paragraph texts, indexed like doc.paragraphs
+        """
+        cached = self._paragraph_text_cache
+        if cached is None or cached[0] is not doc:
+            cached = (doc, [p.text.strip() for p in doc.paragraphs])
+            self._paragraph_text_cache = cached
+        return cached[1]
 
     def cleanup(self):
         """
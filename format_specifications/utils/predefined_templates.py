@@ -1,6 +1,8 @@
 """
 Predefined templates for common document types
 """
+from functools import lru_cache
+
 from .template_definitions import DocumentTemplate, TemplateSection, SectionType
 
 
@@ -1627,6 +1629,25 @@ def get_template(template_id: str):
     return PREDEFINED_TEMPLATES.get(template_id)
 
 
+@lru_cache(maxsize=None)
+def get_template_dict(template_id: str):
+    """
+    Get the serialized (to_dict) form of a predefined template
+
+    Predefined templates never change at runtime, so each one is serialized
+    at most once per process. The returned dict is shared between callers;
+    copy it before modifying.
+
+    Args:
+        template_id: Template identifier
+
+    Returns:
+        Template dictionary or None if not found
+    """
+    template = PREDEFINED_TEMPLATES.get(template_id)
+    return template.to_dict() if template else None
+
+
 def list_all_templates():
     """
     List all predefined templates
@@ -3,6 +3,7 @@ Template data structures for document generation
 """
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional, Dict, Union
 
 
@@ -15,7 +16,7 @@ class SectionType(Enum):
     OPTIONAL = "optional"         # Optional content
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateSection:
     """Represents a single section in a template"""
     id: str                              # Unique identifier (e.g., "overview")
@@ -41,6 +42,26 @@ class DocumentTemplate:
     created_by: str = "system"           # Creator (system/user)
     version: str = "1.0"                 # Template version
 
+    @cached_property
+    def total_subsection_count(self) -> int:
+        """Number of direct subsections across all top-level sections (computed once)"""
+        return sum(len(s.subsections) for s in self.sections)
+
+    @cached_property
+    def _sections_by_id(self) -> Dict[str, TemplateSection]:
+        """Section id -> section, including nested subsections (built on first lookup)"""
+        by_id = {}
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
+            by_id.setdefault(section.id, section)
+            stack.extend(reversed(section.subsections))
+        return by_id
+
+    def get_section(self, section_id: str) -> Optional[TemplateSection]:
+        """Get a section or nested subsection by id, or None if not found"""
+        return self._sections_by_id.get(section_id)
+
     def to_dict(self) -> Dict:
         """Convert template to dictionary for JSON serialization"""
         return {
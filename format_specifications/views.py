@@ -7,6 +7,12 @@ from .utils.ai_word_utils import AITextProcessor
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
+from functools import lru_cache
+import docx
+import io
 import os
 from datetime import datetime
 from django.conf import settings
@@ -17,6 +23,23 @@ import re
 # 获取logger实例
 logger = logging.getLogger(__name__)
 
+# 自定义结构中行首的编号（如 "1. " / "2）" / "3、"），模块加载时编译一次
+NUMBERING_PREFIX_RE = re.compile(r'^\d+[\.\）、]\s*')
+
+
+@lru_cache(maxsize=1)
+def _default_docx_bytes():
+    """读取 python-docx 自带的默认模板（每个进程只读取一次）"""
+    template_path = os.path.join(os.path.dirname(docx.__file__), 'templates', 'default.docx')
+    with open(template_path, 'rb') as f:
+        return f.read()
+
+
+def _new_document():
+    """基于缓存的默认模板创建空白文档，等价于 Document() 但免去每次读取模板文件"""
+    return Document(io.BytesIO(_default_docx_bytes()))
+
+
 # Processing log helper
 def add_processing_log(request, message):
     """Add a log entry to processing status session"""
@@ -411,7 +434,7 @@ def handle_template_optimization(request, uploaded_file):
 
         # Build document from generated content
         output_file_path, output_filename = generate_output_path(uploaded_file)
-        output_doc = Document()
+        output_doc = _new_document()
 
         # Get style config for image dimensions
         from docx.shared import Inches
@@ -735,7 +758,7 @@ def handle_custom_optimization(request, uploaded_file):
 
         # Build document
         output_file_path, output_filename = generate_output_path(uploaded_file)
-        output_doc = Document()
+        output_doc = _new_document()
 
         # Get style config for image dimensions
         from docx.shared import Inches
@@ -854,9 +877,9 @@ def parse_custom_structure(structure_text):
         clean_title = line
         if line[0].isdigit() and ('.' in line or ')' in line or '、' in line):
             # Extract title after number
-            parts = re.split(r'^[\d]+[\.\）、]\s*', line, 1)
-            if len(parts) > 1:
-                clean_title = parts[1]
+            match = NUMBERING_PREFIX_RE.match(line)
+            if match:
+                clean_title = line[match.end():]
 
         sections.append({
             'title': clean_title,
@@ -1029,11 +1052,7 @@ def segment_document(request):
 
         # 4. 提取文档文本
         doc = Document(tmp_file_path)
-        paragraphs = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:  # 跳过空段落
-                paragraphs.append(text)
+        paragraphs = [text for para in doc.paragraphs if (text := para.text.strip())]  # 跳过空段落
 
         full_text = "\n\n".join(paragraphs)
         logger.info(f"提取了 {len(paragraphs)} 个段落，共 {len(full_text)} 个字符")
@@ -1041,12 +1060,10 @@ def segment_document(request):
         # 5. 调用分割方法
         processor = AITextProcessor()
 
-        if include_metadata:
-            segments = processor.segment_text(full_text, mode=mode, include_metadata=True)
-            logger.info(f"分割完成，共 {len(segments)} 个片段（包含元数据）")
-        else:
-            segments = processor.segment_text(full_text, mode=mode, include_metadata=False)
-            logger.info(f"分割完成，共 {len(segments)} 个片段")
+        # 元数据（类型、位置）由 _build_segmented_document 按序号直接写出，
+        # 无需为每个片段构造字典
+        segments = processor.segment_text(full_text, mode=mode, include_metadata=False)
+        logger.info(f"分割完成，共 {len(segments)} 个片段" + ("（包含元数据）" if include_metadata else ""))
 
         # 6. 构建输出文档
         output_filename = f"segmented_{mode}_{uploaded_file.name}"
@@ -1085,12 +1102,12 @@ def _build_segmented_document(segments, mode, include_metadata, output_path):
     构建分割后的Word文档
 
     参数:
-    - segments: 分割后的片段列表或字典列表
+    - segments: 分割后的片段列表或字典列表（字符串片段的类型取 mode，位置取其序号）
     - mode: 分割模式
     - include_metadata: 是否包含元数据
-    - output_path: 输出文件路径
+    - output_path: 输出文件路径，或可写的二进制文件对象（如 io.BytesIO）
     """
-    doc = Document()
+    doc = _new_document()
 
     # 添加标题
     title_text = {
@@ -1113,41 +1130,103 @@ def _build_segmented_document(segments, mode, include_metadata, output_path):
     # 添加分隔线
     doc.add_paragraph("_" * 80)
 
-    # 添加每个片段
+    # 添加每个片段：一次性拼接所有段落的 XML 并解析，避免逐段调用 add_paragraph
+    paragraphs_xml = []
     if include_metadata:
         # 包含元数据的格式
         for i, segment in enumerate(segments, 1):
+            if isinstance(segment, str):
+                segment_type, position, text = mode, i - 1, segment
+            else:
+                # 字典形式（兼容性处理）
+                segment_type = segment.get('type', mode)
+                position = segment.get('position', i - 1)
+                text = segment.get('text', '')
+
             # 元数据信息
-            meta_para = doc.add_paragraph()
-            meta_para.add_run(f"[片段 {i}]").bold = True
-            meta_para.add_run(f" 类型: {segment.get('type', mode)} | ")
-            meta_para.add_run(f"位置: {segment.get('position', i-1)}")
-            meta_para.runs[0].font.size = Pt(9)
-            meta_para.runs[0].font.color.rgb = None
+            paragraphs_xml.append(
+                '<w:p>'
+                + _run_xml(f"[片段 {i}]", size=Pt(9), bold=True)
+                + _run_xml(f" 类型: {segment_type} | ")
+                + _run_xml(f"位置: {position}")
+                + '</w:p>'
+            )
 
             # 片段内容
-            content_para = doc.add_paragraph(segment.get('text', ''))
-            content_para.runs[0].font.size = Pt(11)
+            paragraphs_xml.append(f"<w:p>{_run_xml(text, size=Pt(11))}</w:p>")
 
             # 片段间空行
-            doc.add_paragraph()
+            paragraphs_xml.append('<w:p/>')
     else:
         # 简单格式，只显示文本
         for i, segment in enumerate(segments, 1):
-            if isinstance(segment, str):
-                # 纯文本片段
-                content_para = doc.add_paragraph(f"[{i}] {segment}")
-                content_para.runs[0].font.size = Pt(11)
-            else:
+            if not isinstance(segment, str):
                 # 字典形式（兼容性处理）
-                content_para = doc.add_paragraph(f"[{i}] {segment.get('text', segment)}")
-                content_para.runs[0].font.size = Pt(11)
+                segment = segment.get('text', segment)
+            paragraphs_xml.append(f"<w:p>{_run_xml(f'[{i}] {segment}', size=Pt(11))}</w:p>")
+
+    _append_paragraphs_xml(doc, paragraphs_xml)
 
     # 保存文档
     doc.save(output_path)
     logger.info(f"文档构建完成，共 {len(segments)} 个片段")
 
 
+def _run_xml(text, size=None, bold=False):
+    """
+    生成单个 <w:r> 的 XML 片段
+
+    与 python-docx 的 run.text 行为一致：换行转换为 <w:br/>，制表符转换为 <w:tab/>。
+
+    参数:
+    - text: 文本内容
+    - size: 字号（docx.shared.Length，可选）
+    - bold: 是否加粗
+    """
+    run_props = ''
+    if bold or size is not None:
+        run_props = '<w:rPr>'
+        if bold:
+            run_props += '<w:b/>'
+        if size is not None:
+            run_props += f'<w:sz w:val="{round(size.pt * 2)}"/>'
+        run_props += '</w:rPr>'
+
+    content = []
+    for line_no, line in enumerate(str(text).split('\n')):
+        if line_no:
+            content.append('<w:br/>')
+        for tab_no, chunk in enumerate(line.split('\t')):
+            if tab_no:
+                content.append('<w:tab/>')
+            if chunk:
+                content.append(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>')
+
+    return f"<w:r>{run_props}{''.join(content)}</w:r>"
+
+
+def _append_paragraphs_xml(doc, paragraphs_xml):
+    """
+    将多个 <w:p> XML 片段一次性解析并追加到文档正文末尾（位于 sectPr 之前）
+
+    参数:
+    - doc: python-docx Document 对象
+    - paragraphs_xml: <w:p> XML 字符串列表
+    """
+    if not paragraphs_xml:
+        return
+
+    fragment = parse_xml(f"<w:body {nsdecls('w')}>{''.join(paragraphs_xml)}</w:body>")
+    body = doc.element.body
+    sect_pr = body.sectPr
+
+    for paragraph in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+
+
 # ==================== 模板生成功能 (Template-Based Generation) ====================
 
 def template_generation_page(request):
@@ -1403,7 +1482,7 @@ def _build_document_from_template(template, generated_content, output_path, extr
     from .utils.image_tracker import ImageReinsertionStrategy
     from docx.shared import Inches
 
-    doc = Document()
+    doc = _new_document()
 
     # 匹配图片到章节
     image_insertions = []
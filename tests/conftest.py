@@ -0,0 +1,37 @@
+"""
+Shared pytest configuration
+
+Bootstraps Django once per test session so individual test modules do not
+each repeat the sys.path / settings / django.setup() boilerplate. With
+pytest-django installed the plugin performs the setup from pytest.ini and
+the guarded fallback below is a no-op.
+"""
+import os
+import sys
+
+import django
+import pytest
+from django.apps import apps
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+
+if not apps.ready:
+    django.setup()
+
+# Django's test Client sends requests with the 'testserver' host
+from django.conf import settings
+if 'testserver' not in settings.ALLOWED_HOSTS:
+    settings.ALLOWED_HOSTS.append('testserver')
+
+# Reuse AI template-generation results across test reruns (off in production)
+settings.AI_RESULT_CACHE_ENABLED = True
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """AITextProcessor shared by all tests; it only holds configuration"""
+    from format_specifications.utils.ai_word_utils import AITextProcessor
+    return AITextProcessor()
@@ -2,27 +2,33 @@
 End-to-end test for segmentation feature
 Tests the complete workflow from document upload to output generation
 """
+import io
 import os
 import sys
+from functools import lru_cache
 import django
+from django.apps import apps
 from docx import Document
 from docx.shared import Pt
 
-# Setup Django environment
-# Navigate to project root from tests/e2e/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, PROJECT_ROOT)
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
-django.setup()
+# Django is bootstrapped once per session by tests/conftest.py under pytest;
+# set it up here only when this file is run directly as a script
+if not apps.ready:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+    django.setup()
 
 from format_specifications.utils.ai_word_utils import AITextProcessor
 from format_specifications.views import _build_segmented_document
 from format_specifications.utils import generate_output_path
+from format_specifications.utils.document_extractor import DocumentExtractor
 import tempfile
+from tests.helpers import run_concurrently
 
 
-def create_test_document():
-    """Create a test Word document with various content"""
+@lru_cache(maxsize=1)
+def _test_document_bytes():
+    """Build the test Word document once per session and return its bytes"""
     doc = Document()
 
     # Add title
@@ -46,9 +52,16 @@ def create_test_document():
     doc.add_heading('二、第二章', level=1)
     doc.add_paragraph('这是第二章的内容。')
 
-    # Save to temporary file
-    tmp_path = tempfile.mktemp(suffix='.docx')
-    doc.save(tmp_path)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def create_test_document(tmp_dir):
+    """Write the test Word document into tmp_dir with a single write"""
+    tmp_path = os.path.join(tmp_dir, 'test_document.docx')
+    with open(tmp_path, 'wb') as f:
+        f.write(_test_document_bytes())
     return tmp_path
 
 
@@ -58,17 +71,14 @@ def test_paragraph_segmentation():
     print("TEST 1: Paragraph Segmentation Mode")
     print("=" * 60)
 
-    # Create test document
-    doc_path = create_test_document()
-    print(f"[INFO] Created test document: {doc_path}")
+    # Create test document; the directory is removed even if extraction fails
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        doc_path = create_test_document(tmp_dir)
+        print(f"[INFO] Created test document: {doc_path}")
 
-    # Extract text
-    doc = Document(doc_path)
-    paragraphs = []
-    for para in doc.paragraphs:
-        text = para.text.strip()
-        if text:
-            paragraphs.append(text)
+        # Extract text
+        doc = Document(doc_path)
+        paragraphs = [t for p in doc.paragraphs if (t := p.text.strip())]
 
     full_text = "\n\n".join(paragraphs)
     print(f"[INFO] Extracted {len(paragraphs)} paragraphs from document")
@@ -82,23 +92,17 @@ def test_paragraph_segmentation():
         preview = segment[:50] + "..." if len(segment) > 50 else segment
         print(f"  [{i}] {preview}")
 
-    # Build output document
-    output_path = tempfile.mktemp(suffix='.docx')
-    _build_segmented_document(segments, 'paragraph', False, output_path)
-    print(f"[SUCCESS] Output document created: {output_path}")
+    # Build output document in memory
+    buf = io.BytesIO()
+    _build_segmented_document(segments, 'paragraph', False, buf)
+    print(f"[SUCCESS] Output document created ({buf.tell()} bytes)")
 
     # Verify output
-    output_doc = Document(output_path)
+    buf.seek(0)
+    output_doc = Document(buf)
     output_paras = [p.text for p in output_doc.paragraphs if p.text.strip()]
     print(f"[INFO] Output document has {len(output_paras)} paragraphs")
 
-    # Cleanup
-    try:
-        os.unlink(doc_path)
-        os.unlink(output_path)
-    except:
-        pass
-
     return len(segments) > 0
 
 
@@ -108,13 +112,13 @@ def test_sentence_segmentation():
     print("TEST 2: Sentence Segmentation Mode")
     print("=" * 60)
 
-    # Create test document
-    doc_path = create_test_document()
-    print(f"[INFO] Created test document: {doc_path}")
+    # Create test document; the directory is removed even if extraction fails
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        doc_path = create_test_document(tmp_dir)
+        print(f"[INFO] Created test document: {doc_path}")
 
-    # Extract text
-    doc = Document(doc_path)
-    text = " ".join([p.text.strip() for p in doc.paragraphs if p.text.strip()])
+        # Extract text straight from the XML, no python-docx object model needed
+        text = DocumentExtractor.fast_extract_text(doc_path, separator=" ")
     print(f"[INFO] Extracted text ({len(text)} characters)")
 
     # Perform segmentation
@@ -127,17 +131,10 @@ def test_sentence_segmentation():
     if len(segments) > 5:
         print(f"  ... and {len(segments) - 5} more sentences")
 
-    # Build output document
-    output_path = tempfile.mktemp(suffix='.docx')
-    _build_segmented_document(segments, 'sentence', False, output_path)
-    print(f"[SUCCESS] Output document created: {output_path}")
-
-    # Cleanup
-    try:
-        os.unlink(doc_path)
-        os.unlink(output_path)
-    except:
-        pass
+    # Build output document in memory
+    buf = io.BytesIO()
+    _build_segmented_document(segments, 'sentence', False, buf)
+    print(f"[SUCCESS] Output document created ({buf.tell()} bytes)")
 
     return len(segments) > 0
 
@@ -148,13 +145,14 @@ def test_semantic_segmentation():
     print("TEST 3: Semantic Segmentation Mode")
     print("=" * 60)
 
-    # Create test document
-    doc_path = create_test_document()
-    print(f"[INFO] Created test document: {doc_path}")
+    # Create test document; the directory is removed even if extraction fails
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        doc_path = create_test_document(tmp_dir)
+        print(f"[INFO] Created test document: {doc_path}")
 
-    # Extract text
-    doc = Document(doc_path)
-    text = "\n\n".join([p.text.strip() for p in doc.paragraphs if p.text.strip()])
+        # Extract text
+        doc = Document(doc_path)
+        text = "\n\n".join(t for p in doc.paragraphs if (t := p.text.strip()))
     print(f"[INFO] Extracted text with headings")
 
     # Perform segmentation
@@ -166,17 +164,10 @@ def test_semantic_segmentation():
         preview = segment[:60] + "..." if len(segment) > 60 else segment
         print(f"  [{i}] {preview}")
 
-    # Build output document
-    output_path = tempfile.mktemp(suffix='.docx')
-    _build_segmented_document(segments, 'semantic', False, output_path)
-    print(f"[SUCCESS] Output document created: {output_path}")
-
-    # Cleanup
-    try:
-        os.unlink(doc_path)
-        os.unlink(output_path)
-    except:
-        pass
+    # Build output document in memory
+    buf = io.BytesIO()
+    _build_segmented_document(segments, 'semantic', False, buf)
+    print(f"[SUCCESS] Output document created ({buf.tell()} bytes)")
 
     return len(segments) > 0
 
@@ -217,14 +208,15 @@ def test_output_document_format():
 
     # Create test data
     segments = ["这是第一段", "这是第二段", "这是第三段"]
-    output_path = tempfile.mktemp(suffix='.docx')
 
-    # Build document
-    _build_segmented_document(segments, 'paragraph', False, output_path)
-    print(f"[INFO] Created output document: {output_path}")
+    # Build document in memory
+    buf = io.BytesIO()
+    _build_segmented_document(segments, 'paragraph', False, buf)
+    print(f"[INFO] Created output document ({buf.tell()} bytes)")
 
     # Verify document structure
-    doc = Document(output_path)
+    buf.seek(0)
+    doc = Document(buf)
     paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
 
     print(f"[RESULT] Document has {len(paragraphs)} paragraphs:")
@@ -242,12 +234,6 @@ def test_output_document_format():
     print("  - Metadata present")
     print("  - Content segments present")
 
-    # Cleanup
-    try:
-        os.unlink(output_path)
-    except:
-        pass
-
     return True
 
 
@@ -257,14 +243,15 @@ def main():
     print("END-TO-END SEGMENTATION TESTING")
     print("=" * 60)
 
-    results = {}
-
     try:
-        results['paragraph'] = test_paragraph_segmentation()
-        results['sentence'] = test_sentence_segmentation()
-        results['semantic'] = test_semantic_segmentation()
-        results['metadata'] = test_metadata_inclusion()
-        results['format'] = test_output_document_format()
+        # The tests share no state, so run them concurrently
+        results = run_concurrently({
+            'paragraph': test_paragraph_segmentation,
+            'sentence': test_sentence_segmentation,
+            'semantic': test_semantic_segmentation,
+            'metadata': test_metadata_inclusion,
+            'format': test_output_document_format,
+        })
 
     except Exception as e:
         print(f"\n[ERROR] Test failed: {e}")
@@ -4,21 +4,27 @@ Test the web interface for template generation
 import os
 import sys
 import django
+from django.apps import apps
 
-# Setup Django environment
-# Navigate to project root from tests/e2e/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, PROJECT_ROOT)
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json as _json
 
-# Add testserver to ALLOWED_HOSTS before django.setup()
-from django.conf import settings
-if 'testserver' not in settings.ALLOWED_HOSTS:
-    settings.ALLOWED_HOSTS.append('testserver')
+# Django is bootstrapped once per session by tests/conftest.py under pytest;
+# set it up here only when this file is run directly as a script
+if not apps.ready:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+    django.setup()
 
-django.setup()
+    # Add testserver to ALLOWED_HOSTS
+    from django.conf import settings
+    if 'testserver' not in settings.ALLOWED_HOSTS:
+        settings.ALLOWED_HOSTS.append('testserver')
 
 from django.test import Client
+from django.urls import reverse
 from format_specifications.services.template_manager import TemplateManager
 
 def test_template_manager():
@@ -71,8 +77,9 @@ def test_views():
         return False
 
     # Test API endpoint
-    if TemplateManager.list_available_templates():
-        template_id = TemplateManager.list_available_templates()[0][0]
+    templates = TemplateManager.list_available_templates()
+    if templates:
+        template_id = templates[0][0]
         response = client.get(f'/api/template/{template_id}/')
         print(f"\nAPI endpoint status: {response.status_code}")
 
@@ -80,8 +87,7 @@ def test_views():
             print("[SUCCESS] API endpoint working")
 
             # Check response content
-            import json
-            data = json.loads(response.content)
+            data = _json.loads(response.content)
             if data.get('success'):
                 print(f"  Template name: {data.get('template', {}).get('name')}")
         else:
@@ -97,8 +103,6 @@ def test_url_routing():
     print("TEST 3: URL Routing")
     print("=" * 60)
 
-    from django.urls import reverse
-
     try:
         # Test URL reverse
         url1 = reverse('template_generation_page')
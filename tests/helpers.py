@@ -0,0 +1,40 @@
+"""
+Shared helpers for the test modules that also run as standalone scripts
+"""
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Bullet characters the Windows console cannot encode, mapped for printing
+SANITIZE = str.maketrans({'•': '-', '●': '-'})
+
+
+def run_concurrently(tests, max_workers=4):
+    """
+    Run independent tests on a thread pool.
+
+    Each test's stdout is captured in its own buffer and replayed in
+    declaration order afterwards, so concurrent output never interleaves.
+    """
+    real_stdout = sys.stdout
+    local = threading.local()
+    buffers = {name: io.StringIO() for name in tests}
+
+    class _PerThreadStdout(io.TextIOBase):
+        def write(self, s):
+            return getattr(local, 'buffer', real_stdout).write(s)
+
+    def run(name, fn):
+        local.buffer = buffers[name]
+        return fn()
+
+    sys.stdout = _PerThreadStdout()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(run, name, fn) for name, fn in tests.items()}
+        return {name: future.result() for name, future in futures.items()}
+    finally:
+        sys.stdout = real_stdout
+        for buffer in buffers.values():
+            real_stdout.write(buffer.getvalue())
@@ -4,17 +4,19 @@ Test AI template generation functionality
 import os
 import sys
 import django
+from django.apps import apps
 
-# Setup Django environment
-# Navigate to project root from tests/integration/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, PROJECT_ROOT)
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
-django.setup()
+# Django is bootstrapped once per session by tests/conftest.py under pytest;
+# set it up here only when this file is run directly as a script
+if not apps.ready:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+    django.setup()
 
 from format_specifications.utils.predefined_templates import get_template
 from format_specifications.utils.ai_word_utils import AITextProcessor
 from format_specifications.utils.document_extractor import DocumentExtractor
+from tests.helpers import SANITIZE, run_concurrently
 
 
 def test_skeleton_generation():
@@ -42,7 +44,7 @@ def test_skeleton_generation():
 
     try:
         # Generate content
-        generated = processor.generate_from_template(
+        generated = processor.generate_from_template_batch(
             template=template,
             user_outline=user_outline,
             tone='direct'
@@ -55,8 +57,8 @@ def test_skeleton_generation():
             if content:
                 # Clean Unicode characters for Windows console output
                 preview = content[:150].replace('\n', ' ')
-                section_id_clean = section_id.replace('•', '-').replace('●', '-')
-                preview_clean = preview.replace('•', '-').replace('●', '-')
+                section_id_clean = section_id.translate(SANITIZE)
+                preview_clean = preview.translate(SANITIZE)
                 print(f"\n[{section_id_clean}]")
                 print(f"  {preview_clean}...")
 
@@ -111,7 +113,7 @@ def test_hybrid_generation():
 
     try:
         # Generate content with source document
-        generated = processor.generate_from_template(
+        generated = processor.generate_from_template_batch(
             template=template,
             user_outline=user_outline,
             source_document_text=source_text,
@@ -125,8 +127,8 @@ def test_hybrid_generation():
             if content:
                 # Clean Unicode characters for Windows console output
                 preview = content[:150].replace('\n', ' ')
-                section_id_clean = section_id.replace('•', '-').replace('●', '-')
-                preview_clean = preview.replace('•', '-').replace('●', '-')
+                section_id_clean = section_id.translate(SANITIZE)
+                preview_clean = preview.translate(SANITIZE)
                 print(f"\n[{section_id_clean}]")
                 print(f"  {preview_clean}...")
 
@@ -167,7 +169,7 @@ def test_list_sections():
 
     try:
         # Generate content
-        generated = processor.generate_from_template(
+        generated = processor.generate_from_template_batch(
             template=template,
             user_outline=user_outline,
             tone='direct'
@@ -183,8 +185,8 @@ def test_list_sections():
             content = generated.get(section_id, "")
             if content:
                 preview = content[:200].replace('\n', ' ')
-                section_id_clean = section_id.replace('•', '-').replace('●', '-')
-                preview_clean = preview.replace('•', '-').replace('●', '-')
+                section_id_clean = section_id.translate(SANITIZE)
+                preview_clean = preview.translate(SANITIZE)
                 print(f"\n[{section_id_clean}]")
                 print(f"  {preview_clean}...")
 
@@ -221,7 +223,7 @@ def test_nested_sections():
 
     try:
         # Generate content
-        generated = processor.generate_from_template(
+        generated = processor.generate_from_template_batch(
             template=template,
             user_outline=user_outline,
             tone='direct'
@@ -237,8 +239,8 @@ def test_nested_sections():
             content = generated.get(section_id, "")
             if content:
                 preview = content[:100].replace('\n', ' ')
-                section_id_clean = section_id.replace('•', '-').replace('●', '-')
-                preview_clean = preview.replace('•', '-').replace('●', '-')
+                section_id_clean = section_id.translate(SANITIZE)
+                preview_clean = preview.translate(SANITIZE)
                 print(f"\n  [{section_id_clean}]")
                 print(f"    {preview_clean}...")
 
@@ -258,14 +260,15 @@ def main():
     print("AI TEMPLATE GENERATION TESTING")
     print("=" * 60)
 
-    results = {}
-
     try:
         # Note: These tests require valid ZHIPU_API_KEY in .env file
-        results['skeleton'] = test_skeleton_generation()
-        results['hybrid'] = test_hybrid_generation()
-        results['list_sections'] = test_list_sections()
-        results['nested_sections'] = test_nested_sections()
+        # The tests are network-bound and independent, so run them concurrently
+        results = run_concurrently({
+            'skeleton': test_skeleton_generation,
+            'hybrid': test_hybrid_generation,
+            'list_sections': test_list_sections,
+            'nested_sections': test_nested_sections,
+        })
 
     except Exception as e:
         print(f"\n[ERROR] Test failed: {e}")
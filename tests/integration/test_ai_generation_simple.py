@@ -4,13 +4,14 @@ Simple test for AI template generation - just verify it works
 import os
 import sys
 import django
-
-# Setup Django environment
-# Navigate to project root from tests/integration/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, PROJECT_ROOT)
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
-django.setup()
+from django.apps import apps
+
+# Django is bootstrapped once per session by tests/conftest.py under pytest;
+# set it up here only when this file is run directly as a script
+if not apps.ready:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'format_specifications.settings')
+    django.setup()
 
 from format_specifications.utils.predefined_templates import get_template
 from format_specifications.utils.ai_word_utils import AITextProcessor